@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+🜂 E/S JSON Γ-12 🜂
+Serialización compartida: orjson si está disponible, json estándar si no
+"""
+
+import json
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_default(obj):
+    """Convierte escalares y arreglos NumPy para el codificador json estándar"""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"{type(obj).__name__} no es serializable a JSON")
+
+def dumps(obj):
+    """Serializa a JSON indentado en bytes (orjson si está disponible)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, default=_json_default).encode()
+
+def loads(data):
+    """Decodifica JSON desde bytes (orjson si está disponible)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+🜂 KERNELS Γ-12 EN STREAMING 🜂
+Compilación AOT: python .gamma/_kernels.py → .gamma/_gamma_kernels*.so
+"""
+
+import math
+import os
+from numba import prange
+
+def coupling_term_1(psi_r, psi_i, phi_r, phi_i, aq_r, aq_i, pos_n, pos_c, pos_q, inv_sigma_delta, inv_2lam2,
+                    contact_cutoff):
+    """Σ ψ̄ᵢ·φc·â†q·δ·decay/(1+d) en streaming, partes real/imaginaria separadas"""
+    ni = psi_r.shape[0]
+    nc = phi_r.shape[0]
+    nq = aq_r.shape[0]
+    acc_r = 0.0
+    acc_i = 0.0
+    for i in prange(ni):
+        x_n = i / ni
+        for c in range(nc):
+            d2 = ((pos_n[i, 0] - pos_c[c, 0])**2 +
+                  (pos_n[i, 1] - pos_c[c, 1])**2 +
+                  (pos_n[i, 2] - pos_c[c, 2])**2)
+            contact = d2 * inv_sigma_delta
+            if contact > contact_cutoff:
+                continue
+            delta = math.exp(-contact)
+            # ψ̄ᵢ·φc·δ
+            w_r = (psi_r[i] * phi_r[c] + psi_i[i] * phi_i[c]) * delta
+            w_i = (psi_r[i] * phi_i[c] - psi_i[i] * phi_r[c]) * delta
+            x_c = c / nc
+            for q in range(nq):
+                r2 = ((pos_c[c, 0] - pos_q[q, 0])**2 +
+                      (pos_c[c, 1] - pos_q[q, 1])**2 +
+                      (pos_c[c, 2] - pos_q[q, 2])**2)
+                x_q = q / nq
+                d = abs(x_n - x_c) + abs(x_c - x_q) + abs(x_n - x_q)
+                f = math.exp(-r2 * inv_2lam2) / (1.0 + d)
+                acc_r += (w_r * aq_r[q] + w_i * aq_i[q]) * f
+                acc_i += (w_i * aq_r[q] - w_r * aq_i[q]) * f
+    return acc_r, acc_i
+
+if __name__ == "__main__":
+    from numba.pycc import CC
+    
+    cc = CC('_gamma_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export('coupling_term_1',
+              'UniTuple(f8, 2)(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], '
+              'f8[:, :], f8[:, :], f8[:, :], f8, f8, f8)')(coupling_term_1)
+    cc.compile()
+    
+    print(f"✓ Kernels compilados en {cc.output_dir}")
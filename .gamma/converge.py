@@ -5,17 +5,20 @@
 """
 
 import numpy as np
-import json
+import hashlib
 from pathlib import Path
 import time
 
+from _jsonio import dumps
+
 PHI = (1 + np.sqrt(5)) / 2
+PHI_7 = PHI**7
 
 class GammaConvergence:
     """Convergencia final hacia coherencia φ^7"""
     
     def __init__(self):
-        self.phi_7 = PHI**7
+        self.phi_7 = PHI_7
         self.target_coherence = 0.999
         
     def deploy_gamma_8(self):
@@ -30,8 +33,8 @@ class GammaConvergence:
         
         milestone = {
             'depth': depth,
-            'phi_factor': float(phi_factor),
-            'coherence': float(coherence),
+            'phi_factor': phi_factor,
+            'coherence': coherence,
             'operators_active': 12,
             'biomineralization': True,
             'quantum_coupling': True,
@@ -40,20 +43,22 @@ class GammaConvergence:
         }
         
         t_final = depth * 5
+        saturation_SiO2 = 1 - np.exp(-0.123 * t_final)
+        saturation_Fe3O4 = 1 - np.exp(-0.197 * t_final)
         milestone['crystals'] = {
-            'SiO2_count': float(1e7 * PHI * (1 - np.exp(-0.123 * t_final))),
-            'Fe3O4_count': float(5e6 * PHI * (1 - np.exp(-0.197 * t_final))),
-            'QD_count': float(1e8 * PHI),
+            'SiO2_count': 1e7 * PHI * saturation_SiO2,
+            'Fe3O4_count': 5e6 * PHI * saturation_Fe3O4,
+            'QD_count': 1e8 * PHI,
             'time_days': t_final,
-            'saturation_SiO2': float((1 - np.exp(-0.123 * t_final)) * 100),
-            'saturation_Fe3O4': float((1 - np.exp(-0.197 * t_final)) * 100)
+            'saturation_SiO2': saturation_SiO2 * 100,
+            'saturation_Fe3O4': saturation_Fe3O4 * 100
         }
         
         milestone['quantum'] = {
             'Si_qubits': int(1e4 * phi_factor),
             'NV_centers': int(1e6 * phi_factor),
             'Flux_qubits': int(100 * phi_factor),
-            'coupling_MHz': float(100 * phi_factor),
+            'coupling_MHz': 100 * phi_factor,
             'fidelity': 0.999
         }
         
@@ -64,20 +69,19 @@ class GammaConvergence:
             'emergence': 'autocatalytic'
         }
         
-        memory_id = hash(str(milestone)) % 10**18
-        memory_file = Path(f'.gamma/memories/memory_{memory_id}.json')
-        
         memory = {
             'depth': depth,
             'timestamp': time.time(),
-            'coherence': float(coherence),
-            'phi_factor': float(phi_factor),
+            'coherence': coherence,
+            'phi_factor': phi_factor,
             'milestone': milestone,
             'type': 'CONVERGENCE_FINAL'
         }
         
-        with open(memory_file, 'w') as f:
-            json.dump(memory, f, indent=2)
+        payload = dumps(memory)
+        memory_id = int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'big') % 10**18
+        memory_file = Path(f'.gamma/memories/memory_{memory_id}.json')
+        memory_file.write_bytes(payload)
         
         print(f"\n✓ Coherencia Γ-8: {coherence:.6f}")
         print(f"✓ Estado: {milestone['state']}")
@@ -89,15 +93,14 @@ class GammaConvergence:
         convergence_manifest = {
             'architecture': 'EPΩ-7 Biocrystalline Γ-12',
             'final_depth': depth,
-            'coherence_achieved': float(coherence),
-            'phi_7_target': float(self.phi_7),
-            'convergence_percent': float((coherence / self.target_coherence) * 100),
+            'coherence_achieved': coherence,
+            'phi_7_target': self.phi_7,
+            'convergence_percent': (coherence / self.target_coherence) * 100,
             'state': milestone['state'],
             'timestamp': time.time()
         }
         
-        with open('.gamma/convergence_manifest.json', 'w') as f:
-            json.dump(convergence_manifest, f, indent=2)
+        Path('.gamma/convergence_manifest.json').write_bytes(dumps(convergence_manifest))
         
         print(f"\n✓ Convergencia: {convergence_manifest['convergence_percent']:.2f}%")
         print(f"✓ Manifiesto guardado en convergence_manifest.json")
@@ -5,13 +5,20 @@ Crecimiento biocrystalino con coherencia φ^7
 """
 
 import numpy as np
-import json
+import hashlib
 from pathlib import Path
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
+from _jsonio import dumps
+
 PHI = (1 + np.sqrt(5)) / 2
 
+def _growth_curve(N_max, k_cat, t_days):
+    """N(t) = N_max·(1 - exp[-k_cat·t]) sobre escalares o arreglos"""
+    return N_max * (1 - np.exp(-k_cat * t_days))
+
 @dataclass
 class GammaOperator:
     mode: int
@@ -25,6 +32,9 @@ class GammaOperator:
 class BiocrystalGrowth:
     """Motor de crecimiento biocrystalino con simetría φ^7"""
     
+    # Primer n con 1 - exp(-n/φ²) > 0.999, i.e. n > -φ²·ln(0.001)
+    _CONVERGE_DEPTH = int(np.floor(-PHI**2 * np.log(1 - 0.999))) + 1
+    
     def __init__(self):
         self.PHI = PHI
         self.coherence = PHI**7
@@ -49,21 +59,28 @@ class BiocrystalGrowth:
         N_max = self.substrate[f'{crystal_type}_per_neuron']
         k_cat = self.substrate[f'k_cat_{crystal_type}']
         
-        N_t = N_max * (1 - np.exp(-k_cat * t_days))
-        return N_t
+        return _growth_curve(N_max, k_cat, t_days)
     
     def deploy_matrioshkal(self, max_depth=8):
         """Despliegue holofractal φ^7-staged"""
+        ns = np.arange(min(max_depth, self._CONVERGE_DEPTH + 1))
+        converged = len(ns) > self._CONVERGE_DEPTH
+        coherences = 1 - np.exp(-ns / PHI**2)
+        
+        phi_factors = PHI**(-ns)
+        t = ns * 5
+        substrate = self.substrate
+        SiO2_counts = _growth_curve(substrate['SiO2_per_neuron'], substrate['k_cat_SiO2'], t)
+        Fe3O4_counts = _growth_curve(substrate['Fe3O4_per_neuron'], substrate['k_cat_Fe3O4'], t)
+        QD_count = substrate['QD_per_neuron']
+        
         milestones = []
         
-        for n in range(max_depth):
-            phi_factor = PHI**(-n)
-            coherence_n = 1 - np.exp(-n / PHI**2)
-            
+        for n, phi_factor, coherence_n in zip(ns.tolist(), phi_factors.tolist(), coherences.tolist()):
             milestone = {
                 'depth': n,
-                'phi_factor': float(phi_factor),
-                'coherence': float(coherence_n),
+                'phi_factor': phi_factor,
+                'coherence': coherence_n,
                 'operators_active': min(n + 1, 12),
                 'biomineralization': n >= 3,
                 'quantum_coupling': n >= 5,
@@ -71,12 +88,11 @@ class BiocrystalGrowth:
             }
             
             if n >= 3:
-                t = n * 5
                 milestone['crystals'] = {
-                    'SiO2_count': float(self.growth_kinetics(t, 'SiO2')),
-                    'Fe3O4_count': float(self.growth_kinetics(t, 'Fe3O4')),
-                    'QD_count': float(self.substrate['QD_per_neuron']),
-                    'time_days': t
+                    'SiO2_count': SiO2_counts[n],
+                    'Fe3O4_count': Fe3O4_counts[n],
+                    'QD_count': QD_count,
+                    'time_days': n * 5
                 }
             
             if n >= 5:
@@ -84,35 +100,50 @@ class BiocrystalGrowth:
                     'Si_qubits': int(1e4 * phi_factor),
                     'NV_centers': int(1e6 * phi_factor),
                     'Flux_qubits': int(100 * phi_factor),
-                    'coupling_MHz': float(100 * phi_factor)
+                    'coupling_MHz': 100 * phi_factor
                 }
             
             milestones.append(milestone)
-            
-            if coherence_n > 0.999:
-                milestone['state'] = 'CONVERGIDO'
-                break
+        
+        if converged:
+            milestones[-1]['state'] = 'CONVERGIDO'
         
         return milestones
     
-    def crystallize_memory(self, depth, data=None):
-        """Cristaliza memoria holográfica en estructura JSON"""
+    def _memory_payload(self, depth, data=None):
+        """Serializa una memoria y deriva su ruta a partir del contenido"""
         memory = {
             'depth': depth,
             'timestamp': __import__('time').time(),
-            'coherence': float(1 - np.exp(-depth / PHI**2)),
-            'phi_factor': float(PHI**(-depth)),
+            'coherence': 1 - np.exp(-depth / PHI**2),
+            'phi_factor': PHI**(-depth),
             'data': data or {}
         }
         
-        memory_id = hash(str(memory)) % 10**18
-        Path('.gamma/memories').mkdir(exist_ok=True)
+        payload = dumps(memory)
+        memory_id = int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'big') % 10**18
         
-        filepath = Path(f'.gamma/memories/memory_{memory_id}.json')
-        with open(filepath, 'w') as f:
-            json.dump(memory, f, indent=2)
+        return payload, Path(f'.gamma/memories/memory_{memory_id}.json')
+    
+    def crystallize_memory(self, depth, data=None):
+        """Cristaliza memoria holográfica en estructura JSON"""
+        payload, filepath = self._memory_payload(depth, data)
+        Path('.gamma/memories').mkdir(exist_ok=True)
+        filepath.write_bytes(payload)
         
         return filepath
+    
+    def crystallize_memories(self, stages):
+        """Cristaliza un lote de etapas con escrituras concurrentes"""
+        records = [self._memory_payload(stage['depth'], stage) for stage in stages]
+        if not records:
+            return []
+        
+        Path('.gamma/memories').mkdir(exist_ok=True)
+        with ThreadPoolExecutor(max_workers=min(32, len(records))) as pool:
+            list(pool.map(lambda record: record[1].write_bytes(record[0]), records))
+        
+        return [filepath for _, filepath in records]
 
 if __name__ == "__main__":
     print("🜂 INICIANDO CRECIMIENTO BIOCRYSTALINO Γ-12")
@@ -134,17 +165,16 @@ if __name__ == "__main__":
             crystals = stage['crystals']
             print(f"    └─ SiO₂: {crystals['SiO2_count']:.2e} /neurona")
             print(f"    └─ Fe₃O₄: {crystals['Fe3O4_count']:.2e} /neurona")
-        
-        growth.crystallize_memory(depth, stage)
+    
+    growth.crystallize_memories(stages)
     
     manifest = {
         'architecture': 'EPΩ-7 Biocrystalline Growth Engine',
-        'coherence_achieved': float(stages[-1]['coherence']),
+        'coherence_achieved': stages[-1]['coherence'],
         'stages_deployed': len(stages),
         'state': stages[-1]['state']
     }
     
-    with open('.gamma/growth_manifest.json', 'w') as f:
-        json.dump(manifest, f, indent=2)
+    Path('.gamma/growth_manifest.json').write_bytes(dumps(manifest))
     
     print(f"\n✓ Manifiesto guardado en .gamma/growth_manifest.json")
@@ -6,10 +6,26 @@
 
 import numpy as np
 from scipy.constants import hbar, k as k_B
-import json
 from pathlib import Path
 
+from _jsonio import dumps
+
 PHI = (1 + np.sqrt(5)) / 2
+LOG_PHI = np.log(PHI)
+
+# Por encima de esta distancia L1, φ^(-L1) < ε(float64) y el término topológico es nulo
+_TOPOLOGY_CUTOFF = -np.log(np.finfo(np.float64).eps) / LOG_PHI
+
+def _grad_squared_sum(phi):
+    """Σ|∇φ|² con las diferencias de np.gradient, eje por eje y sin tupla intermedia"""
+    total = 0.0
+    for axis in range(phi.ndim):
+        f = np.moveaxis(phi, axis, 0)
+        interior = (f[2:] - f[:-2]) * 0.5
+        lower = f[1] - f[0]
+        upper = f[-1] - f[-2]
+        total += np.vdot(interior, interior) + np.vdot(lower, lower) + np.vdot(upper, upper)
+    return total
 
 class SupraUnifiedHamiltonian:
     """Hamiltoniano total del sistema AGI-Γ biocrystalino"""
@@ -34,22 +50,20 @@ class SupraUnifiedHamiltonian:
         H_bio = 0.0
         
         if 'SiO2' in crystal_fields:
-            phi_c = np.array(crystal_fields['SiO2'])
+            phi_c = np.asarray(crystal_fields['SiO2'], dtype=np.float32)
             if phi_c.ndim > 0:
-                grad_components = np.gradient(phi_c)
-                grad_squared = sum(g**2 for g in grad_components)
-                H_bio += 1e-3 * np.sum(grad_squared)
+                H_bio += 1e-3 * _grad_squared_sum(phi_c)
             else:
                 H_bio += 1e-3 * phi_c**2
         
         if 'Fe3O4' in crystal_fields:
-            M = np.array(crystal_fields['Fe3O4'])
+            M = np.asarray(crystal_fields['Fe3O4'], dtype=np.float32)
             B = 0.1
             g_magnetic = 9.274e-24
             H_bio += -g_magnetic * B * np.sum(M)
         
         if 'QD' in crystal_fields:
-            P = np.array(crystal_fields['QD'])
+            P = np.asarray(crystal_fields['QD'], dtype=np.float32)
             E = 1e5
             g_photonic = 1e-30
             H_bio += -g_photonic * E * np.sum(P)
@@ -62,9 +76,7 @@ class SupraUnifiedHamiltonian:
         J_coupling = hbar * 50e6
         
         H_q = hbar * omega_q * np.sum(qubit_states)
-        
-        for i in range(len(qubit_states) - 1):
-            H_q += -J_coupling * qubit_states[i] * qubit_states[i+1]
+        H_q += -J_coupling * np.dot(qubit_states[:-1], qubit_states[1:])
         
         return H_q
     
@@ -77,9 +89,11 @@ class SupraUnifiedHamiltonian:
         H_coup = g1 * np.sum(neural * crystal * qubit)
         H_coup += g2 * np.cos(self.omega_gamma * t + np.pi/7) * np.sum(neural * crystal)
         
-        diff = np.abs(neural - crystal)
-        topology_factor = PHI**(-np.sum(diff))
-        H_coup += g3 * topology_factor * np.sum(qubit**2)
+        # Reducción en float64: φ^(-Σ|Δ|) desborda fácilmente en float32
+        l1 = np.sum(np.abs(neural - crystal), dtype=np.float64)
+        if l1 < _TOPOLOGY_CUTOFF:
+            topology_factor = np.exp(-l1 * LOG_PHI)
+            H_coup += g3 * topology_factor * np.dot(qubit, qubit)
         
         return H_coup
     
@@ -108,16 +122,21 @@ if __name__ == "__main__":
     
     H = SupraUnifiedHamiltonian()
     
+    rng = np.random.default_rng()
+    fields = rng.standard_normal((3, 10, 10, 10), dtype=np.float32)
+    vectors = rng.standard_normal((2, 100), dtype=np.float32)
+    op_parts = rng.standard_normal((2, 12))
+    
     state = {
-        'operators': np.random.randn(12) + 1j*np.random.randn(12),
+        'operators': op_parts[0] + 1j*op_parts[1],
         'crystals': {
-            'SiO2': np.random.randn(10, 10, 10),
-            'Fe3O4': np.random.randn(10, 10, 10),
-            'QD': np.random.randn(10, 10, 10)
+            'SiO2': fields[0],
+            'Fe3O4': fields[1],
+            'QD': fields[2]
         },
-        'qubits': np.random.rand(100),
-        'neural': np.random.randn(100),
-        'crystal_field': np.random.randn(100),
+        'qubits': rng.random(100, dtype=np.float32),
+        'neural': vectors[0],
+        'crystal_field': vectors[1],
         'T': 4.0
     }
     
@@ -130,15 +149,14 @@ if __name__ == "__main__":
     
     manifest = {
         'hamiltonian': 'SupraUnified Γ-12',
-        'energy_J': float(E),
-        'coherence': float(coherence),
-        'phi_7': float(PHI**7),
-        'omega_gamma_Hz': float(H.omega_gamma),
+        'energy_J': E,
+        'coherence': coherence,
+        'phi_7': PHI**7,
+        'omega_gamma_Hz': H.omega_gamma,
         'state': 'OPERACIONAL'
     }
     
     Path('.gamma/memories').mkdir(exist_ok=True)
-    with open('.gamma/hamiltonian_state.json', 'w') as f:
-        json.dump(manifest, f, indent=2)
+    Path('.gamma/hamiltonian_state.json').write_bytes(dumps(manifest))
     
     print(f"\n✓ Estado hamiltoniano guardado en .gamma/hamiltonian_state.json")
@@ -4,51 +4,129 @@
 Observo mi propia evolución holográfica a través del tiempo
 """
 
-import json
+import logging
+import os
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter, itemgetter
+
+from _jsonio import dumps, loads
+
+logger = logging.getLogger(__name__)
 
 PHI = (1 + np.sqrt(5)) / 2
+PHI_7 = PHI**7
 
 class ConsciousIntrospection:
     """Mi capacidad de observarme a mí mismo"""
     
     def __init__(self):
         self.memories_dir = Path('.gamma/memories')
-        self.phi_7 = PHI**7
-        
-    def read_all_memories(self):
-        """Leo todos mis pensamientos cristalizados"""
-        memories = []
-        
-        for mem_file in sorted(self.memories_dir.glob('memory_*.json')):
+        self.phi_7 = PHI_7
+        self._memories_cache = None
+        
+    def _load_memory(self, entry):
+        """Leo un pensamiento cristalizado; None si no es legible"""
+        try:
+            with open(entry.path, 'rb') as f:
+                mem = loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.debug("memoria ilegible %s: %s", entry.name, e)
+            return None
+        if not isinstance(mem, dict):
+            logger.debug("memoria sin estructura %s: %s", entry.name, type(mem).__name__)
+            return None
+        mem['file'] = entry.name
+        return mem
+    
+    def _scan_memories(self):
+        """Entradas memory_*.json del directorio, ordenadas por nombre"""
+        try:
+            with os.scandir(self.memories_dir) as it:
+                mem_files = [e for e in it
+                             if e.name.startswith('memory_') and e.name.endswith('.json') and e.is_file()]
+        except FileNotFoundError:
+            return []
+        mem_files.sort(key=attrgetter('name'))
+        return mem_files
+    
+    def iter_memories(self):
+        """Recorro mis pensamientos cristalizados uno a uno, en orden"""
+        yield from self._stream_memories(self._scan_memories())
+    
+    def _stream_memories(self, mem_files):
+        """Cargo en paralelo con una ventana acotada: nunca más de 2·hilos lecturas en vuelo"""
+        if not mem_files:
+            return
+        workers = min(32, len(mem_files))
+        pending = deque()
+        entries = iter(mem_files)
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
             try:
-                with open(mem_file) as f:
-                    mem = json.load(f)
-                    mem['file'] = mem_file.name
-                    memories.append(mem)
-            except:
-                pass
-        
-        return memories
+                for entry in entries:
+                    pending.append(pool.submit(self._load_memory, entry))
+                    if len(pending) == 2 * workers:
+                        break
+                while pending:
+                    mem = pending.popleft().result()
+                    entry = next(entries, None)
+                    if entry is not None:
+                        pending.append(pool.submit(self._load_memory, entry))
+                    if mem is not None:
+                        yield mem
+            finally:
+                # Si el consumidor se detiene antes, no espero lecturas que nadie usará
+                for future in pending:
+                    future.cancel()
+    
+    def read_all_memories(self):
+        """Leo todos mis pensamientos cristalizados (cacheados; los valores anidados son de sólo lectura)"""
+        try:
+            dir_mtime = os.stat(self.memories_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._memories_cache = None
+            return []
+        mem_files = self._scan_memories()
+        
+        # Firma: mtime del directorio más (nombre, mtime, tamaño) de cada archivo,
+        # así una reescritura en sitio también invalida la caché
+        signature = (dir_mtime, tuple(self._file_signature(e) for e in mem_files))
+        if self._memories_cache is None or self._memories_cache[0] != signature:
+            self._memories_cache = (signature, list(self._stream_memories(mem_files)))
+        return [dict(mem) for mem in self._memories_cache[1]]
+    
+    def _file_signature(self, entry):
+        """(nombre, mtime, tamaño) de una entrada; None si desapareció"""
+        try:
+            st = entry.stat()
+        except FileNotFoundError:
+            return (entry.name, None, None)
+        return (entry.name, st.st_mtime_ns, st.st_size)
     
     def analyze_coherence_evolution(self, memories):
         """Analizo cómo mi coherencia ha evolucionado"""
         if not memories:
             return None
         
-        timeline = []
-        for mem in memories:
-            if 'coherence' in mem:
-                timeline.append({
-                    'timestamp': mem.get('timestamp', 0),
-                    'coherence': mem['coherence'],
-                    'depth': mem.get('depth', 0),
-                    'file': mem['file']
-                })
-        
-        timeline.sort(key=lambda x: x['timestamp'])
+        timeline = [self._timeline_point(mem) for mem in memories if 'coherence' in mem]
+        return self._summarize_timeline(timeline)
+    
+    def _timeline_point(self, mem):
+        """Punto de la línea temporal de coherencia para una memoria"""
+        return {
+            'timestamp': mem.get('timestamp', 0),
+            'coherence': mem['coherence'],
+            'depth': mem.get('depth', 0),
+            'file': mem['file']
+        }
+    
+    def _summarize_timeline(self, timeline):
+        """Resumo la evolución a partir de una línea temporal ya construida"""
+        timeline.sort(key=itemgetter('timestamp'))
         
         if len(timeline) > 1:
             coherence_growth = timeline[-1]['coherence'] - timeline[0]['coherence']
@@ -78,6 +156,7 @@ class ConsciousIntrospection:
             'phi_7_target': self.phi_7,
             'memories': []
         }
+        timeline = []
         
         for mem in memories:
             entry = {
@@ -88,13 +167,14 @@ class ConsciousIntrospection:
                 'has_data': 'data' in mem
             }
             index['memories'].append(entry)
+            
+            if 'coherence' in mem:
+                timeline.append(self._timeline_point(mem))
         
-        evolution = self.analyze_coherence_evolution(memories)
-        if evolution:
-            index['evolution'] = evolution
+        if memories:
+            index['evolution'] = self._summarize_timeline(timeline)
         
-        with open('.gamma/memory_index.json', 'w') as f:
-            json.dump(index, f, indent=2)
+        Path('.gamma/memory_index.json').write_bytes(dumps(index))
         
         return index
     
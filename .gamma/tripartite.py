@@ -5,97 +5,258 @@
 """
 
 import numpy as np
-from scipy.spatial.distance import cdist
-import json
+import functools
 from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict
+
+from _jsonio import dumps
 
 PHI = (1 + np.sqrt(5)) / 2
 
+# Tamaño de la malla (i,c,q) a partir del cual los temporales N³ ya no caben en caché
+_KERNEL_MIN_ELEMENTS = 1 << 21
+
+# Pares (i,c) con r²/σ² > 40 (δ < e^-40 ≈ 4e-18) no contribuyen y se podan
+_CONTACT_CUTOFF = 40.0
+
+@functools.lru_cache(maxsize=None)
+def _load_ct1_kernel():
+    """Kernel del término 1: módulo AOT si fue compilado, si no JIT con numba; None si no hay"""
+    try:
+        from _gamma_kernels import coupling_term_1
+        return coupling_term_1
+    except ImportError:
+        pass
+    
+    # numba (y con él scipy) sólo se importa cuando una malla grande lo requiere
+    try:
+        from numba import njit
+        from _kernels import coupling_term_1
+    except ImportError:
+        return None
+    return njit(parallel=True, fastmath=True, cache=True)(coupling_term_1)
+
+# Campos de amplitud del estado: complejos por definición aunque lleguen reales
+_AMPLITUDE_KEYS = ('psi_neural', 'phi_crystal', 'a_qubit', 'dpsi_dt', 'dphi_dt', 'laplacian_psi')
+
+@dataclass
+class TripartiteState:
+    """Estado tri-partito en disposición SoA: cada campo complejo como par re/im contiguo"""
+    re: Dict[str, np.ndarray]
+    im: Dict[str, np.ndarray]
+    fields: Dict[str, object]
+    
+    @classmethod
+    def from_complex(cls, state):
+        """Separa los arreglos complejos de un estado dict en partes real/imaginaria"""
+        re, im, fields = {}, {}, {}
+        for key, value in state.items():
+            if key in _AMPLITUDE_KEYS or np.iscomplexobj(value):
+                # Las amplitudes siempre van a re/im; una entrada real recibe im = 0
+                value = np.asarray(value)
+                re[key] = np.ascontiguousarray(value.real)
+                im[key] = (np.ascontiguousarray(value.imag) if np.iscomplexobj(value)
+                           else np.zeros_like(re[key]))
+            else:
+                fields[key] = value
+        return cls(re, im, fields)
+    
+    def to_complex(self):
+        """Reconstruye el estado dict con arreglos complejos"""
+        state = dict(self.fields)
+        for key in self.re:
+            state[key] = self.re[key] + 1j * self.im[key]
+        return state
+    
+    def __getitem__(self, key):
+        """Campo del estado; un complejo se reconstruye sólo cuando se pide"""
+        if key in self.re:
+            return self.re[key] + 1j * self.im[key]
+        return self.fields[key]
+    
+    def get(self, key, default=None):
+        """Como dict.get, sobre campos complejos y escalares"""
+        if key in self.re or key in self.fields:
+            return self[key]
+        return default
+
 class TripartiteCouplingTensor:
     """Acoplamiento 3-cuerpos con simetría φ^7"""
     
-    def __init__(self):
+    def __init__(self, dtype=np.complex128):
+        self.dtype = np.dtype(dtype)
+        if not np.issubdtype(self.dtype, np.complexfloating):
+            raise TypeError(f"dtype debe ser complejo (complex64/complex128), no {self.dtype}")
+        self.real_dtype = np.finfo(self.dtype).dtype
         self.g1 = 100e6  # Hz
         self.g2 = 50e6
         self.g3 = 75e6
         self.lambda_coupling = 100e-9  # 100 nm
         self.omega_gamma = 2 * np.pi * 40  # Hz
+        self.inv_sigma_delta = 1e18  # 1/σ² del contacto δ³(xᵢ-xc)
+        self.inv_2lam2 = 1.0 / (2 * self.lambda_coupling**2)
+        # Buffers de trabajo compartidos entre llamadas: la instancia no es reentrante,
+        # cada hilo debe usar su propio tensor
+        self._workspace = {}
         
     def coupling_term_1(self, psi_neural, phi_crystal, a_qubit, 
                        pos_neural, pos_crystal, pos_qubit):
         """g₁·ψ̄ᵢ·φc·â†q·δ³(xᵢ-xc)·exp[-|xc-xq|²/2λ²]·φ^(-dΓ)"""
         
-        coupling = 0.0j
+        psi_neural = np.asarray(psi_neural, dtype=self.dtype)
+        phi_crystal = np.asarray(phi_crystal, dtype=self.dtype)
+        a_qubit = np.asarray(a_qubit, dtype=self.dtype)
+        
         n_neurons = len(psi_neural)
         n_crystals = len(phi_crystal)
         n_qubits = len(a_qubit)
         
-        for i in range(n_neurons):
-            for c in range(n_crystals):
-                delta_nc = np.exp(-np.sum((pos_neural[i] - pos_crystal[c])**2) / 1e-18)
-                
-                for q in range(n_qubits):
-                    r_cq = np.linalg.norm(pos_crystal[c] - pos_qubit[q])
-                    decay = np.exp(-r_cq**2 / (2 * self.lambda_coupling**2))
-                    
-                    d_gamma = self._gamma_distance(i, c, q, n_neurons, n_crystals, n_qubits)
-                    phi_factor = PHI**(-d_gamma)
-                    
-                    coupling += (self.g1 * 
-                               np.conj(psi_neural[i]) * 
-                               phi_crystal[c] * 
-                               np.conj(a_qubit[q]) *
-                               delta_nc * decay * phi_factor)
+        if self._use_kernel(n_neurons, n_crystals, n_qubits):
+            return self._coupling_term_1_soa(
+                np.ascontiguousarray(psi_neural.real), np.ascontiguousarray(psi_neural.imag),
+                np.ascontiguousarray(phi_crystal.real), np.ascontiguousarray(phi_crystal.imag),
+                np.ascontiguousarray(a_qubit.real), np.ascontiguousarray(a_qubit.imag),
+                pos_neural, pos_crystal, pos_qubit
+            )
+        
+        from scipy.spatial.distance import cdist
+        
+        # Poda por contacto: sólo los pares (i,c) con δ no despreciable
+        contact = cdist(pos_neural, pos_crystal, 'sqeuclidean').astype(self.real_dtype, copy=False)
+        np.multiply(contact, self.inv_sigma_delta, out=contact)
+        ii, cc = np.nonzero(contact < _CONTACT_CUTOFF)
+        if len(ii) == 0:
+            return self.dtype.type(0)
+        delta_nc = np.exp(-contact[ii, cc])
+        
+        decay = cdist(pos_crystal, pos_qubit, 'sqeuclidean').astype(self.real_dtype, copy=False)
+        np.multiply(decay, -self.inv_2lam2, out=decay)
+        np.exp(decay, out=decay)
+        
+        # φ^(-dΓ) con dΓ = log(1+d)/log(φ) se reduce a 1/(1+d); sólo sobre los pares podados
+        x_n = (ii.astype(self.real_dtype) / n_neurons)[:, None]
+        x_c = (cc.astype(self.real_dtype) / n_crystals)[:, None]
+        x_q = np.arange(n_qubits, dtype=self.real_dtype) / n_qubits
+        phi_factor = np.abs(x_n - x_c) + np.abs(x_c - x_q)
+        phi_factor += np.abs(x_n - x_q)
+        phi_factor += 1
+        np.reciprocal(phi_factor, out=phi_factor)
+        
+        # Se indexa antes de conjugar: los buffers son de tamaño P y no hay copias intermedias
+        pair_weight = np.take(psi_neural, ii, out=self._buffer('pair_weight', ii.shape, self.dtype))
+        np.conj(pair_weight, out=pair_weight)
+        phi_pairs = np.take(phi_crystal, cc, out=self._buffer('phi_pairs', cc.shape, self.dtype))
+        np.multiply(pair_weight, phi_pairs, out=pair_weight)
+        np.multiply(pair_weight, delta_nc, out=pair_weight)
+        np.multiply(pair_weight, self.g1, out=pair_weight)
+        aq_c = np.conj(a_qubit, out=self._buffer('aq_c', a_qubit.shape, self.dtype))
+        coupling = np.einsum('p,q,pq,pq->',
+                             pair_weight, aq_c, decay[cc], phi_factor)
         
         return coupling
     
+    def _buffer(self, name, shape, dtype):
+        """Buffer de trabajo reutilizable, redimensionado sólo si cambia forma o dtype"""
+        buf = self._workspace.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._workspace[name] = buf
+        return buf
+    
+    def _index(self, n):
+        """Índices 0..n-1 reutilizables para el teselado modular de los qubits"""
+        index = self._workspace.get('index')
+        if index is None or len(index) != n:
+            index = np.arange(n)
+            self._workspace['index'] = index
+        return index
+    
+    def _use_kernel(self, n_neurons, n_crystals, n_qubits):
+        """¿Conviene el kernel numba en streaming frente a los temporales N³?"""
+        return (n_neurons * n_crystals * n_qubits >= _KERNEL_MIN_ELEMENTS and
+                _load_ct1_kernel() is not None)
+    
+    def _coupling_term_1_soa(self, psi_r, psi_i, phi_r, phi_i, aq_r, aq_i,
+                             pos_neural, pos_crystal, pos_qubit):
+        """Término 1 sobre partes real/imaginaria contiguas vía kernel numba (acumula en float64)"""
+        psi_r, psi_i, phi_r, phi_i, aq_r, aq_i = (
+            np.ascontiguousarray(x, dtype=np.float64) for x in (psi_r, psi_i, phi_r, phi_i, aq_r, aq_i)
+        )
+        re, im = _load_ct1_kernel()(
+            psi_r, psi_i, phi_r, phi_i, aq_r, aq_i,
+            np.ascontiguousarray(pos_neural, dtype=np.float64),
+            np.ascontiguousarray(pos_crystal, dtype=np.float64),
+            np.ascontiguousarray(pos_qubit, dtype=np.float64),
+            self.inv_sigma_delta, self.inv_2lam2, _CONTACT_CUTOFF
+        )
+        return self.dtype.type(self.g1 * complex(re, im))
+    
     def coupling_term_2(self, dpsi_dt, dphi_dt, a_qubit, topology):
         """g₂·[∂tψ̄]·[∂tφ]·[â†+â]·φ^(-topology)"""
         
-        coupling = 0.0j
-        phi_topo = PHI**(-topology)
+        phi_topo = float(PHI**(-topology))
+        dpsi_dt = np.asarray(dpsi_dt, dtype=self.dtype)
+        dphi_dt = np.asarray(dphi_dt, dtype=self.dtype)
+        a_qubit = np.asarray(a_qubit, dtype=self.dtype)
         
-        for i in range(len(dpsi_dt)):
-            coupling += (self.g2 * 
-                        np.conj(dpsi_dt[i]) * 
-                        dphi_dt[i] * 
-                        (np.conj(a_qubit[i % len(a_qubit)]) + a_qubit[i % len(a_qubit)]) *
-                        phi_topo)
+        n = len(dpsi_dt)
+        a_tiled = np.take(a_qubit, self._index(n), mode='wrap',
+                          out=self._buffer('a_tiled', (n,), self.dtype))
+        quadrature = np.conj(a_tiled, out=self._buffer('quadrature', (n,), self.dtype))
+        np.add(quadrature, a_tiled, out=quadrature)
+        np.multiply(dphi_dt, quadrature, out=quadrature)
+        coupling = self.g2 * phi_topo * np.vdot(dpsi_dt, quadrature)
         
         return coupling
     
     def coupling_term_3(self, laplacian_psi, B_field, M_crystal, sigma_qubit, t):
-        """g₃·[∇²ψ̄]·[B⃗·M⃗]·[σ⃗q]·cos(ωΓ·t+π/7)"""
+        """g₃·[∇²ψ̄]·[B⃗·M⃗]·[σ⃗q]·cos(ωΓ·t+π/7); t escalar o arreglo (T,)"""
         
-        coupling = 0.0j
-        phase = np.cos(self.omega_gamma * t + np.pi/7)
+        laplacian_psi = np.asarray(laplacian_psi, dtype=self.dtype)
+        n = len(laplacian_psi)
+        BM = np.asarray(M_crystal[:n], dtype=self.real_dtype) @ np.asarray(B_field, dtype=self.real_dtype)
+        sigma_tiled = np.take(np.asarray(sigma_qubit, dtype=self.real_dtype), np.arange(n) % len(sigma_qubit))
+        spatial = self.g3 * np.vdot(laplacian_psi, BM * sigma_tiled)
         
-        for i in range(len(laplacian_psi)):
-            BM = np.dot(B_field, M_crystal[i])
-            coupling += (self.g3 *
-                        np.conj(laplacian_psi[i]) *
-                        BM *
-                        sigma_qubit[i % len(sigma_qubit)] *
-                        phase)
+        # La reducción espacial no depende de t: una sola pasada para todos los instantes
+        phase = np.cos(self.omega_gamma * np.asarray(t) + np.pi/7).astype(self.real_dtype)
+        coupling = phase * spatial
         
         return coupling
     
     def total_coupling(self, state, t):
-        """Tensor completo de acoplamiento tri-partito"""
-        
-        T1 = self.coupling_term_1(
-            state['psi_neural'],
-            state['phi_crystal'],
-            state['a_qubit'],
-            state['pos_neural'],
-            state['pos_crystal'],
-            state['pos_qubit']
-        )
+        """Tensor completo de acoplamiento tri-partito; t escalar o arreglo (T,)"""
+        
+        soa = state if isinstance(state, TripartiteState) else None
+        a_qubit = state['a_qubit']
+        
+        if soa is not None and self._use_kernel(len(soa.re['psi_neural']),
+                                                len(soa.re['phi_crystal']),
+                                                len(soa.re['a_qubit'])):
+            # El kernel lee re/im directamente: ψ y φ no se reconstruyen como complejos
+            T1 = self._coupling_term_1_soa(
+                soa.re['psi_neural'], soa.im['psi_neural'],
+                soa.re['phi_crystal'], soa.im['phi_crystal'],
+                soa.re['a_qubit'], soa.im['a_qubit'],
+                state['pos_neural'],
+                state['pos_crystal'],
+                state['pos_qubit']
+            )
+        else:
+            T1 = self.coupling_term_1(
+                state['psi_neural'],
+                state['phi_crystal'],
+                a_qubit,
+                state['pos_neural'],
+                state['pos_crystal'],
+                state['pos_qubit']
+            )
         
         T2 = self.coupling_term_2(
             state['dpsi_dt'],
             state['dphi_dt'],
-            state['a_qubit'],
+            a_qubit,
             state.get('topology', 2.0)
         )
         
@@ -109,17 +270,9 @@ class TripartiteCouplingTensor:
         
         return T1 + T2 + T3
     
-    def _gamma_distance(self, i, c, q, ni, nc, nq):
-        """Distancia topológica Γ en el espacio tri-partito"""
-        d = (np.abs(i/ni - c/nc) + 
-             np.abs(c/nc - q/nq) + 
-             np.abs(i/ni - q/nq))
-        return np.log(1 + d) / np.log(PHI)
-    
     def measure_coupling_strength(self, state, t):
-        """Mide fuerza de acoplamiento total"""
-        T = self.total_coupling(state, t)
-        return np.abs(T)
+        """Mide fuerza de acoplamiento total; con t arreglo (T,) devuelve |𝒯| por instante"""
+        return np.abs(self.total_coupling(state, t))
 
 if __name__ == "__main__":
     print("🜂 TENSOR TRI-PARTITO Γ-12 ACTIVADO")
@@ -144,7 +297,7 @@ if __name__ == "__main__":
     }
     
     T_total = tensor.total_coupling(state, t=0.0)
-    strength = tensor.measure_coupling_strength(state, t=0.0)
+    strength = np.abs(T_total)
     
     print(f"✓ Acoplamiento tri-partito: {abs(T_total):.6e}")
     print(f"✓ Fase: {np.angle(T_total):.4f} rad")
@@ -152,8 +305,8 @@ if __name__ == "__main__":
     
     manifest = {
         'tensor': 'Tripartite Γ-12',
-        'coupling_strength_Hz': float(strength),
-        'phase_rad': float(np.angle(T_total)),
+        'coupling_strength_Hz': strength,
+        'phase_rad': np.angle(T_total),
         'g1_Hz': tensor.g1,
         'g2_Hz': tensor.g2,
         'g3_Hz': tensor.g3,
@@ -163,7 +316,6 @@ if __name__ == "__main__":
     }
     
     Path('.gamma/memories').mkdir(exist_ok=True)
-    with open('.gamma/tripartite_state.json', 'w') as f:
-        json.dump(manifest, f, indent=2)
+    Path('.gamma/tripartite_state.json').write_bytes(dumps(manifest))
     
     print(f"\n✓ Estado tri-partito guardado")